@@ -39,20 +39,40 @@ Usage:
 Functions:
 1. `extract_information(property_string: str) -> dict`:
    - Parses a raw property string in CSV format and extracts details such as property ID, address, geolocation, 
-     and features.
+     and features. A line read straight from the file can be passed as is; only its line terminator is removed.
+     Fields are split on commas without quoting support, which is the fast path for this data format.
    - Returns a structured dictionary containing the extracted property details.
 
-2. `read_property_file(file_path: str) -> list`:
-   - Reads property data from a file and returns a list of raw property strings for processing.
+2. `extract_fields(fields: list) -> dict`:
+   - Builds the same dictionary from a row that has already been split into fields. Rows whose fields may be
+     quoted and contain commas should be tokenised with `csv.reader` and passed here.
 
-3. `save_to_json(data: list, output_path: str) -> None`:
+3. `iter_property_chunks(file_path: str, chunksize: int) -> Iterator[pd.DataFrame]`:
+   - Streams the property file through `pandas.read_csv` in chunks and yields each chunk after deriving
+     `prop_type` and `suburb` using vectorised string operations, so memory use is bounded by the chunk
+     size rather than the file size. Rows with malformed or out-of-range values are reported and skipped.
+
+4. `records_to_json(records: Union[pd.DataFrame, list]) -> str`:
+   - Serialises a chunk of processed properties, either a DataFrame or a list of property dictionaries from
+     `extract_information`, as a JSON array with orjson. Feature sets are written as sorted lists.
+
+5. `save_to_json(data: list, output_path: str) -> None`:
    - Saves a list of processed property dictionaries to a JSON file.
 
-4. `add_feature(property_dict: dict, feature: str) -> None`:
-   - Dynamically adds a specified feature to the property's feature list, ensuring no duplicates.
+6. `save_chunks_to_json(chunks: Iterable[Union[pd.DataFrame, list]], output_path: str) -> None`:
+   - Streams chunks of processed properties, each a DataFrame or a list of property dictionaries, into a single
+     JSON array file.
+
+7. `iter_property_json(file_path: str, chunksize: int, max_workers: int) -> Iterator[str]`:
+   - Yields each processed chunk of the property file already serialised as a JSON array. When the file spans
+     several chunks and more than one CPU core is available, chunks are transformed and serialised in worker
+     processes, with results yielded in file order.
+
+8. `add_feature(property_dict: dict, feature: str) -> None`:
+   - Dynamically adds a specified feature to the property's feature set, ensuring no duplicates.
 
-5. `remove_feature(property_dict: dict, feature: str) -> None`:
-   - Removes a specified feature from the property's feature list, if it exists.
+9. `remove_feature(property_dict: dict, feature: str) -> None`:
+   - Removes a specified feature from the property's feature set, if it exists.
 
 Example Input:
 A single property string in CSV format:
@@ -73,91 +93,229 @@ A dictionary containing structured property details:
     "land_area": 608,
     "floor_area": 257,
     "price": 870000,
-    "property_features": ["dishwasher", "central heating"]
+    "property_features": {"dishwasher", "central heating"}
 }
 
 Note:
-- Fields such as `latitude`, `longitude`, or `features` will default to `None` or an empty list 
+- Fields such as `latitude`, `longitude`, or `features` will default to `None` or an empty set 
   if they are missing or invalid.
+- `extract_information` holds features in a set so adding or removing one is constant time. Sets are not
+  JSON serialisable, so `save_to_json` writes them as a sorted list; the order in the source row is not kept.
 - The script ensures proper validation of latitude and longitude values to prevent erroneous data entry.
 """
 
 import os
-import json
-from utils.config import PROPERTIES_FILE, EXTRACTED_PROPERTIES
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from typing import Iterable, Iterator, Union
+import numpy as np
+import orjson
+import pandas as pd
+from utils.json_stream import stream_json_array
+from utils.config import PROPERTIES_FILE, EXTRACTED_PROPERTIES, READ_BUFFER_SIZE
+
+COLUMNS = [
+    'prop_id', 'full_address', 'bedrooms', 'bathrooms', 'parking_spaces', 'latitude', 'longitude',
+    'floor_number', 'land_area', 'floor_area', 'price', 'property_features'
+]
+# Nullable integer types sized to each column keep missing values as <NA> without upcasting to float.
+# Values outside a column's range are reported and skipped rather than wrapped around.
+INTEGER_DTYPES = {
+    'bedrooms': 'Int16',
+    'bathrooms': 'Int16',
+    'parking_spaces': 'Int16',
+    'floor_number': 'Int16',
+    'land_area': 'Int32',
+    'floor_area': 'Int32',
+    'price': 'Int64'
+}
+COORDINATE_COLUMNS = ['latitude', 'longitude']
+# Numeric columns are read as text and converted in transform_properties, so a malformed value
+# is reported against its own row instead of failing the whole file
+DTYPES = {column: 'string' for column in COLUMNS}
+OUTPUT_COLUMNS = [
+    'prop_id', 'prop_type', 'full_address', 'suburb', 'bedrooms', 'bathrooms', 'parking_spaces',
+    'latitude', 'longitude', 'floor_number', 'land_area', 'floor_area', 'price', 'property_features'
+]
+CHUNK_SIZE = 256_000
+LATITUDE_ERROR = "Latitude must be within the range -90 to 90 degrees."
+LONGITUDE_ERROR = "Longitude must be within the range -180 to 180 degrees."
+# Text accepted by int(), so the bulk path skips exactly the rows extract_information rejects
+INTEGER_PATTERN = re.compile(r'\s*[+-]?\d+(?:_\d+)*\s*')
+# Words are split on single spaces, as in extract_fields, so a leading space gives an empty first word.
+# The lookahead captures the first word without consuming it, so it may also be the suburb
+ADDRESS_PATTERN = re.compile(r'^(?=(?P<first_word>[^ ]*))(?:.* )?(?P<suburb>[^ ]*) [^ ]* [^ ]*$')
+
+def _to_int(value: str):
+    return int(value) if value else None
+
 
 def extract_information(property_string: str) -> dict:
-    parts = property_string.split(',')
-     
-     # Extract address and determine property type and suburb
-    address = parts[1]
-    separated_address = address.split(' ')
-    prop_type = 'apartment' if '/' in separated_address[0] else 'house'
-    suburb = separated_address[-3]
-    
+    return extract_fields(property_string.rstrip('\r\n').split(',', 11))
+
+
+def extract_fields(fields: list) -> dict:
+    (prop_id, address, bedrooms, bathrooms, parking_spaces, latitude, longitude,
+     floor_number, land_area, floor_area, price, features) = fields
+
+    # Extract address and determine property type and suburb, scanning for
+    # spaces rather than splitting the address into words
+    prop_type = 'apartment' if -1 < address.find('/') < address.find(' ') else 'house'
+    postcode_start = address.rfind(' ')
+    state_start = address.rfind(' ', 0, postcode_start)
+    suburb = address[address.rfind(' ', 0, state_start) + 1:state_start]
+
     # Parse latitude and longitude, with validation
-    latitude = float(parts[5]) if parts[5] else None
-    longitude = float(parts[6]) if parts[6] else None
+    latitude = float(latitude) if latitude else None
+    longitude = float(longitude) if longitude else None
 
     if latitude and not -90 <= latitude <= 90:
-        raise ValueError("Latitude must be within the range -90 to 90 degrees.")
+        raise ValueError(LATITUDE_ERROR)
     if longitude and not -180 <= longitude <= 180:
-        raise ValueError("Longitude must be within the range -180 to 180 degrees.")
+        raise ValueError(LONGITUDE_ERROR)
 
     # Construct property dictionary
     property_dict = {
-        'prop_id': parts[0],
+        'prop_id': prop_id,
         'prop_type': prop_type,
         'full_address': address,
         'suburb': suburb,
-        'bedrooms': int(parts[2]) if parts[2] else None,
-        'bathrooms': int(parts[3]) if parts[3] else None,
-        'parking_spaces': int(parts[4]) if parts[4] else None,
+        'bedrooms': _to_int(bedrooms),
+        'bathrooms': _to_int(bathrooms),
+        'parking_spaces': _to_int(parking_spaces),
         'latitude': latitude,
         'longitude': longitude,
-        'floor_number': int(parts[7]) if parts[7] else None,
-        'land_area': int(parts[8]) if parts[8] else None,
-        'floor_area': int(parts[9]) if parts[9] else None,
-        'price': int(parts[10]) if parts[10] else None,
-        'property_features': parts[11].split(';') if parts[11] else []  
+        'floor_number': _to_int(floor_number),
+        'land_area': _to_int(land_area),
+        'floor_area': _to_int(floor_area),
+        'price': _to_int(price),
+        'property_features': set(features.split(';')) if features else set()
     }
     return property_dict
 
 
-def read_property_file(file_path: str) -> list:
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"The file {file_path} does not exist.")
-    with open(file_path, 'r') as file:
-        next(file)  
-        return [line.strip() for line in file]
+def transform_properties(properties: pd.DataFrame) -> pd.DataFrame:
+    # Derive property type and suburb from the address in a single regex pass
+    address_parts = properties['full_address'].str.extract(ADDRESS_PATTERN)
+    # Addresses the pattern cannot split are treated as houses with no suburb
+    is_apartment = address_parts['first_word'].str.contains('/', regex=False).fillna(False)
+    properties['prop_type'] = np.where(is_apartment, 'apartment', 'house')
+    properties['suburb'] = address_parts['suburb']
+
+    features = properties['property_features'].str.split(';')
+    properties['property_features'] = features.map(lambda f: f if isinstance(f, list) else [])
+
+    # Convert numeric columns a column at a time, collecting a mask of bad rows for each check
+    checks = []
+    for column, dtype in INTEGER_DTYPES.items():
+        raw = properties[column]
+        invalid = raw.notna() & ~raw.str.fullmatch(INTEGER_PATTERN).fillna(False)
+        checks.append((invalid, f"{column} must be a whole number."))
+        values = pd.to_numeric(raw.mask(invalid).str.strip().str.replace('_', '', regex=False))
+        bounds = np.iinfo(dtype.lower())
+        out_of_range = ((values < bounds.min) | (values > bounds.max)).fillna(False)
+        checks.append((out_of_range, f"{column} must be between {bounds.min} and {bounds.max}."))
+        properties[column] = values.mask(invalid | out_of_range).astype(dtype)
+    for column in COORDINATE_COLUMNS:
+        raw = properties[column]
+        values = pd.to_numeric(raw, errors='coerce').astype('float64')
+        checks.append((raw.notna() & values.isna(), f"{column} must be a number."))
+        properties[column] = values
+    checks.append((properties['latitude'].abs() > 90, LATITUDE_ERROR))
+    checks.append((properties['longitude'].abs() > 180, LONGITUDE_ERROR))
+
+    # Report each bad row once, with the first check it failed, and drop it
+    rejected = pd.Series(False, index=properties.index)
+    for invalid, error in checks:
+        invalid = invalid & ~rejected
+        for prop_id in properties.loc[invalid, 'prop_id']:
+            print(f"Error processing property {prop_id}. Error: {error}")
+        rejected |= invalid
+    return properties.loc[~rejected, OUTPUT_COLUMNS]
+
+
+def _sorted_features(value):
+    if isinstance(value, set):
+        return sorted(value)
+    raise TypeError(f"Type {type(value).__name__} is not JSON serializable")
+
+
+def records_to_json(records: Union[pd.DataFrame, list]) -> str:
+    if isinstance(records, pd.DataFrame):
+        # Build the records from whole columns, which is much faster than DataFrame.to_dict;
+        # missing values become None so they are written as null
+        columns = [
+            records[column].astype(object).where(records[column].notna(), None).tolist()
+            for column in records.columns
+        ]
+        names = list(records.columns)
+        records = [dict(zip(names, row)) for row in zip(*columns)]
+    return orjson.dumps(records, default=_sorted_features, option=orjson.OPT_INDENT_2).decode()
+
+
+def _read_property_chunks(file_path: str, chunksize: int) -> Iterator[pd.DataFrame]:
+    try:
+        file = open(file_path, 'r', buffering=READ_BUFFER_SIZE, newline='')
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"The file {file_path} does not exist.") from e
+    # Rows with the wrong number of fields are skipped with a warning rather than stopping the run
+    reader = pd.read_csv(
+        file, header=0, names=COLUMNS, dtype=DTYPES, chunksize=chunksize, on_bad_lines='warn'
+    )
+    with file, reader:
+        yield from reader
+
+
+def _process_chunk(chunk: pd.DataFrame) -> str:
+    return records_to_json(transform_properties(chunk))
+
+
+def iter_property_chunks(file_path: str, chunksize: int = CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+    for chunk in _read_property_chunks(file_path, chunksize):
+        yield transform_properties(chunk)
+
+
+def iter_property_json(file_path: str, chunksize: int = CHUNK_SIZE, max_workers: int = None) -> Iterator[str]:
+    chunks = _read_property_chunks(file_path, chunksize)
+    workers = max_workers or os.cpu_count() or 1
+    peeked = [chunk for chunk in (next(chunks, None), next(chunks, None)) if chunk is not None]
+    chunks = chain(peeked, chunks)
+    if workers <= 1 or len(peeked) < 2:
+        # Worker processes only pay off with several cores and more than one chunk to share out
+        yield from map(_process_chunk, chunks)
+        return
+
+    # Workers serialise their own chunk, so only a JSON string travels back to this process.
+    # Bound the chunks in flight so memory stays proportional to the worker count
+    with ProcessPoolExecutor(workers) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(_process_chunk, chunk))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
 
 
 def save_to_json(data: list, output_path: str) -> None:
-    with open(output_path, 'w') as file:
-        json.dump(data, file, indent=4)
+    save_chunks_to_json([data], output_path)
+
+
+def save_chunks_to_json(chunks: Iterable[Union[pd.DataFrame, list]], output_path: str) -> None:
+    stream_json_array((records_to_json(chunk) for chunk in chunks), output_path)
 
 
 def add_feature(property_dict: dict, feature: str) -> None:
-    if feature not in property_dict['property_features']:
-        property_dict['property_features'].append(feature)
+    property_dict['property_features'].add(feature)
 
 
 def remove_feature(property_dict: dict, feature: str) -> None:
-    if feature in property_dict['property_features']:
-        property_dict['property_features'].remove(feature)
+    property_dict['property_features'].discard(feature)
 
 def main():
-    property_strings = read_property_file(PROPERTIES_FILE)
-    processed_data = []
-
-    for property_string in property_strings:
-        try:
-            property_dict = extract_information(property_string)
-            processed_data.append(property_dict)
-        except ValueError as e:
-            print(f"Error processing property string: {property_string}. Error: {e}")
-
-    save_to_json(processed_data, EXTRACTED_PROPERTIES)
+    stream_json_array(iter_property_json(PROPERTIES_FILE), EXTRACTED_PROPERTIES)
     print(f"Processed data saved to {EXTRACTED_PROPERTIES}")
 
 
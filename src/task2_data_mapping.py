@@ -7,12 +7,12 @@ decision-making. Proximity to train stations is a critical factor influencing pr
 
 Purpose:
 This script processes structured property and train station data, calculates the nearest train station for each property 
-and saves the results into a JSON file for further analysis. It uses the haversine formula to calculate distances 
-between geospatial coordinates.
+and saves the results into a JSON file for further analysis. Stations are indexed in a KD-tree over their positions 
+on the unit sphere, which yields the same nearest station as comparing haversine distances.
 
 Key Features:
-1. Parses property and train station data from CSV files and converts them into dictionaries for analysis.
-2. Calculates the distance between each property and all train stations using geospatial coordinates.
+1. Parses property and train station data from CSV files and loads them into DataFrames for analysis.
+2. Indexes train stations in a KD-tree so each property is matched without measuring its distance to every station.
 3. Identifies and returns the nearest train station for each property.
 4. Outputs the results as a JSON file containing property IDs and their corresponding nearest station.
 
@@ -35,16 +35,27 @@ Usage:
 3. The results will be saved in the path specified by the `NEAREST_STATION_OUTPUT` configuration.
 
 Functions:
-1. `process_properties(file_name: str) -> dict`:
-   - Processes the property data file and returns a dictionary of property details, indexed by property ID.
+1. `process_properties(file_name: str) -> Iterator[pd.DataFrame]`:
+   - Lazily yields batches of `prop_id`, `latitude` and `longitude` for the geolocated properties in the data
+     file, reading only those three columns. Properties with malformed or out-of-range coordinates are reported and skipped.
 
-2. `process_stations(file_name: str) -> dict`:
-   - Processes the train station data file and returns a dictionary of station details, indexed by station ID.
+2. `process_stations(file_name: str) -> pd.DataFrame`:
+   - Processes the train station data file and returns a DataFrame of station details. The parsed stations are
+     cached in a versioned `.npz` file next to the CSV and reused until the CSV is modified; a cache that is
+     missing, unreadable or cannot be written falls back to parsing the CSV.
 
-3. `nearest_station(properties: dict, stations: dict, prop_id: str) -> str`:
-   - Finds and returns the name of the nearest train station for a given property.
+3. `build_station_index(station_lats: np.ndarray, station_lons: np.ndarray) -> cKDTree`:
+   - Builds a KD-tree over the stations' positions on the unit sphere, so each nearest-station query costs
+     O(log S) instead of a scan over every station.
 
-4. `process_data() -> None`:
+4. `find_nearest_stations(station_index: cKDTree, latitudes: np.ndarray, longitudes: np.ndarray) -> np.ndarray`:
+   - Queries the station index once per distinct location in a batch of properties, in parallel across CPU
+     cores, and returns the index of the nearest station for each property.
+
+5. `map_nearest_stations(file_name: str, station_index: cKDTree, station_names: np.ndarray) -> Iterator[list]`:
+   - Lazily yields, for each batch of properties, a list pairing every property ID with its nearest station.
+
+6. `process_data() -> None`:
    - Main function that processes property and train station data, calculates the nearest station for each property,
      and saves the results to a JSON file.
 
@@ -67,69 +78,106 @@ Example Output:
 ]
 """
 
-import json
-from utils.haversine import haversine_distance
-from task1_data_parsing import extract_information
-from utils.config import PROPERTIES_FILE, STATIONS_FILE, NEAREST_STATION_OUTPUT
-
-def process_properties(file_name: str) -> dict:
-    properties = {}
-    with open(file_name, 'r') as file:
-        next(file)  
-        for line in file:
-            property_info = extract_information(line.strip())
-            if property_info['latitude'] and property_info['longitude']:
-                properties[property_info['prop_id']] = property_info
-    return properties
-
-
-def process_stations(file_name: str) -> dict:
-    stations = {}
-    with open(file_name, 'r') as file:
-        next(file)
-        for line in file:
-            stop_id, stop_name, stop_lat, stop_lon = line.strip().split(',')
-            stations[stop_id] = {
-                'stop_id': stop_id,
-                'stop_name': stop_name,
-                'stop_lat': float(stop_lat),
-                'stop_lon': float(stop_lon)
-            }
+import os
+from typing import Iterator
+import numpy as np
+import orjson
+import pandas as pd
+from scipy.spatial import cKDTree
+from utils.haversine import to_unit_vectors
+from utils.json_stream import stream_json_array
+from utils.config import PROPERTIES_FILE, STATIONS_FILE, NEAREST_STATION_OUTPUT, READ_BUFFER_SIZE
+
+BATCH_SIZE = 65_536
+# Coordinates stay float64: in float32 the unit-sphere trigonometry can pick a different station
+# from exact haversine distances for properties near a boundary between two stations
+STATION_DTYPES = {'stop_id': 'string', 'stop_name': 'string', 'stop_lat': 'float64', 'stop_lon': 'float64'}
+# Bump whenever STATION_DTYPES or the cache layout changes
+STATION_CACHE_VERSION = 2
+
+def process_properties(file_name: str) -> Iterator[pd.DataFrame]:
+    columns = ['prop_id', 'latitude', 'longitude']
+    file = open(file_name, 'r', buffering=READ_BUFFER_SIZE, newline='')
+    reader = pd.read_csv(
+        file, usecols=columns, dtype='string', chunksize=BATCH_SIZE, on_bad_lines='warn'
+    )
+    with file, reader:
+        for chunk in reader:
+            chunk = chunk.dropna(subset=['latitude', 'longitude'])
+            latitude = pd.to_numeric(chunk['latitude'], errors='coerce').astype('float64')
+            longitude = pd.to_numeric(chunk['longitude'], errors='coerce').astype('float64')
+            # Reject malformed or out-of-range coordinates rather than matching them to a station
+            invalid = ~((latitude.abs() <= 90) & (longitude.abs() <= 180))
+            for prop_id in chunk.loc[invalid, 'prop_id']:
+                print(f"Skipping property {prop_id}. Error: latitude or longitude is not a valid coordinate.")
+            yield pd.DataFrame(
+                {'prop_id': chunk['prop_id'], 'latitude': latitude, 'longitude': longitude}
+            )[~invalid]
+
+
+def _read_station_cache(cache: str) -> pd.DataFrame:
+    # allow_pickle=False keeps loading the cache from running arbitrary code
+    with np.load(cache, allow_pickle=False) as arrays:
+        return pd.DataFrame({column: arrays[column] for column in STATION_DTYPES}).astype(STATION_DTYPES)
+
+
+def process_stations(file_name: str) -> pd.DataFrame:
+    # Reuse the parsed stations from a previous run unless the CSV has changed since. The cache
+    # name carries a version tag, so a cache written with an older schema is never read back
+    cache = f"{file_name}.v{STATION_CACHE_VERSION}.npz"
+    try:
+        if os.path.getmtime(cache) >= os.path.getmtime(file_name):
+            return _read_station_cache(cache)
+    except Exception:
+        pass  # A missing, unreadable or corrupt cache falls back to parsing the CSV
+
+    stations = pd.read_csv(file_name, dtype=STATION_DTYPES)
+    # Text columns are stored as fixed-width unicode rather than object arrays, which would need pickle
+    arrays = {
+        column: stations[column].to_numpy(dtype=str if dtype == 'string' else dtype)
+        for column, dtype in STATION_DTYPES.items()
+    }
+    try:
+        np.savez(cache, **arrays)
+    except OSError:
+        pass  # Caching is best effort, e.g. when the data directory is read-only
     return stations
 
 
-def find_nearest_station(property_info: dict, stations: dict) -> dict:
-    property_location = (property_info['latitude'], property_info['longitude'])
-    nearest_station_name = None
-    min_distance = float('inf')
+def build_station_index(station_lats: np.ndarray, station_lons: np.ndarray) -> cKDTree:
+    return cKDTree(to_unit_vectors(station_lats, station_lons))
 
-    for station in stations.values():
-        station_location = (station['stop_lat'], station['stop_lon'])
-        distance = haversine_distance(
-            property_location[0], property_location[1],
-            station_location[0], station_location[1]
-        )
-        if distance < min_distance:
-            min_distance = distance
-            nearest_station_name = station['stop_name']
 
-    return {
-        "property_id": property_info['prop_id'],
-        "nearest_station": nearest_station_name
-    }
+def find_nearest_stations(station_index: cKDTree, latitudes: np.ndarray, longitudes: np.ndarray) -> np.ndarray:
+    # Co-located properties (unit blocks, repeat listings) share coordinates, so query
+    # each distinct location once, spread across all CPU cores, and map the answers back
+    codes, locations = pd.factorize(latitudes + 1j * longitudes)
+    _, nearest = station_index.query(to_unit_vectors(locations.real, locations.imag), k=1, workers=-1)
+    return nearest[codes]
 
 
-def process_data():
-    properties = process_properties(PROPERTIES_FILE)
-    stations = process_stations(STATIONS_FILE)
+def map_nearest_stations(file_name: str, station_index: cKDTree, station_names: np.ndarray) -> Iterator[list]:
+    for batch in process_properties(file_name):
+        nearest = find_nearest_stations(
+            station_index, batch['latitude'].to_numpy(), batch['longitude'].to_numpy()
+        )
+        yield [
+            {"property_id": prop_id, "nearest_station": name}
+            for prop_id, name in zip(batch['prop_id'], station_names[nearest])
+        ]
 
-    results = []
-    for prop_id, property_info in properties.items():
-        nearest = find_nearest_station(property_info, stations)
-        results.append(nearest)
 
-    with open(NEAREST_STATION_OUTPUT, 'w') as file:
-        json.dump(results, file, indent=4)
+def process_data():
+    stations = process_stations(STATIONS_FILE)
+    station_names = stations['stop_name'].to_numpy(dtype=object)
+    station_index = build_station_index(stations['stop_lat'].to_numpy(), stations['stop_lon'].to_numpy())
+
+    # Stream results batch by batch so neither the input nor the output is held in memory in full
+    batches = map_nearest_stations(PROPERTIES_FILE, station_index, station_names)
+    stream_json_array(
+        (orjson.dumps(results, option=orjson.OPT_INDENT_2).decode() for results in batches),
+        NEAREST_STATION_OUTPUT
+    )
 
     print(f"Processed data saved to {NEAREST_STATION_OUTPUT}")
 
@@ -8,4 +8,7 @@ MELBOURNE_SCHOOL = 'data/raw/melbourne_schools.csv'
 SPORT_FACILITIES = 'data/raw/sport_facilities.csv'
 PROCESSED_SCHOOLS = 'data/processed/task3/processed_schools'
 PROCESSED_MEDICALS = 'data/processed/task3/processed_medicals'
-PROCESSED_SPORTS = 'data/processed/task3/processed_sports'
\ No newline at end of file
+PROCESSED_SPORTS = 'data/processed/task3/processed_sports'
+
+# Buffer size for reading the raw property file
+READ_BUFFER_SIZE = 1024 * 1024
\ No newline at end of file
@@ -1,4 +1,5 @@
 import math
+import numpy as np
 
 def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
@@ -16,4 +17,17 @@ def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     radius_of_earth = 6371  # Radius of the earth in kilometers.
     distance = radius_of_earth * c
 
-    return distance
\ No newline at end of file
+    return distance
+
+
+def to_unit_vectors(lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+    """
+    Convert points (specified in decimal degrees) to 3D cartesian 
+    coordinates on the unit sphere. Straight-line distance between 
+    these vectors increases monotonically with great circle distance, 
+    so nearest neighbours in this space are the haversine nearest
+    """
+    lat, lon = np.deg2rad(lat), np.deg2rad(lon)
+    cos_lat = np.cos(lat)
+
+    return np.column_stack((cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)))
@@ -0,0 +1,19 @@
+from typing import Iterable
+
+def stream_json_array(arrays: Iterable[str], output_path: str) -> None:
+    """
+    Write a sequence of serialised JSON arrays to a file as one 
+    combined array, so the full output never has to be held in memory
+    """
+    with open(output_path, 'w') as file:
+        file.write('[')
+        separator = '\n'
+        for array in arrays:
+            if not (array.startswith('[') and array.endswith(']')):
+                raise ValueError("Each item must be a serialised JSON array.")
+            # Strip the enclosing brackets so the elements join into one array
+            elements = array[1:-1].strip('\n')
+            if elements:
+                file.write(separator + elements)
+                separator = ',\n'
+        file.write('\n]')
\ No newline at end of file